@@ -15,8 +15,9 @@ You already have:
 """
 
 import os
+import time
 import base64
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, astuple, fields
 from datetime import datetime, timezone
 from typing import List, Optional, Iterable, Dict, Any
 
@@ -32,17 +33,34 @@ from googleapiclient.discovery import build
 # It matches what quickstart.py used.
 SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
 
+# Gmail accepts up to 100 calls per batch request, but batches larger than
+# 50 tend to get rate limited (429), so we stay at 50.
+BATCH_SIZE = 50
+
+# Messages that fail inside a batch are retried in new batches this many
+# times, waiting BATCH_BACKOFF_S, then 2x, 4x, ... seconds before each retry.
+BATCH_RETRIES = 3
+BATCH_BACKOFF_S = 1.0
+
+# Largest page size messages().list() allows.
+LIST_PAGE_SIZE = 500
+
+# Headers load_message() reads; enough for a 'metadata' fetch.
+METADATA_HEADERS = ["Subject", "From", "To", "Date"]
+
 
 # ---------------------------
 # Data structure for 1 email
 # ---------------------------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmailRecord:
     """
     Simple container for one email.
 
     This plays the same role as "Message + some extracted fields"
     in the Java Mailbox class, but flattened and easier to export.
+
+    Uses __slots__ (no per-instance __dict__) and is read-only once built.
     """
     id: str
     threadId: Optional[str]
@@ -127,16 +145,25 @@ class GmailAPIWrapper:
     # --------------------------
     # Helper: header lookup
     # --------------------------
+    @staticmethod
+    def _header_map(payload: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Build a {lowercased header name: value} dict from a Gmail 'payload'
+        in one pass, so several headers can be looked up without rescanning
+        the header list each time. If a header repeats, the first one wins.
+        """
+        return {
+            h.get("name", "").lower(): h.get("value")
+            for h in reversed(payload.get("headers", []))
+        }
+
     @staticmethod
     def _get_header(payload: Dict[str, Any], name: str) -> Optional[str]:
         """
         Given the 'payload' from a Gmail message and a header name
         (e.g., 'Subject', 'From', 'Date'), return its value.
         """
-        for h in payload.get("headers", []):
-            if h.get("name", "").lower() == name.lower():
-                return h.get("value")
-        return None
+        return GmailAPIWrapper._header_map(payload).get(name.lower())
 
     # --------------------------
     # Helper: decode body
@@ -163,8 +190,10 @@ class GmailAPIWrapper:
             return decode_b64(body["data"])
 
         # Case 2: multipart → search through parts
+        # Only look at mimeType while walking; nothing is decoded until we
+        # know which part we want (images and other attachments never are).
         parts = payload.get("parts", []) or []
-        html_fallback = ""
+        html_data: Optional[str] = None
 
         stack = list(parts)
         while stack:
@@ -173,19 +202,20 @@ class GmailAPIWrapper:
             pbody = part.get("body", {})
 
             if "data" in pbody:
-                text = decode_b64(pbody["data"])
                 if mime == "text/plain":
-                    # Prefer plain text
-                    return text
-                if mime == "text/html" and not html_fallback:
-                    # Save HTML as a fallback if no plain text found
-                    html_fallback = text
+                    # Prefer plain text: decode it and stop walking
+                    return decode_b64(pbody["data"])
+                if mime == "text/html" and html_data is None:
+                    # Remember HTML as a fallback if no plain text found
+                    html_data = pbody["data"]
 
             # If this part has sub-parts, push them onto the stack
             subparts = part.get("parts", [])
             stack.extend(subparts or [])
 
-        return html_fallback  # may be "" if nothing found
+        if html_data is None:
+            return ""  # nothing found
+        return decode_b64(html_data)
 
     # --------------------------
     # Helper: parse Date header
@@ -221,53 +251,97 @@ class GmailAPIWrapper:
 
         Returns a list of message IDs matching the Gmail search query.
         This is analogous to Java's mapMessageIds using list().setQ("...").
+
+        Follows nextPageToken until max_results ids are collected, and asks
+        Gmail (via the `fields` mask) to send back only the ids.
         """
         user_id = "me"
         msgs: List[str] = []
+        page_token: Optional[str] = None
+
+        while len(msgs) < max_results:
+            response = (
+                self.service.users()
+                .messages()
+                .list(
+                    userId=user_id,
+                    q=query,
+                    maxResults=min(LIST_PAGE_SIZE, max_results - len(msgs)),
+                    pageToken=page_token,
+                    fields="messages/id,nextPageToken",
+                )
+                .execute()
+            )
 
-        response = (
-            self.service.users()
-            .messages()
-            .list(userId=user_id, q=query, maxResults=max_results)
-            .execute()
-        )
+            msgs.extend([m["id"] for m in response.get("messages", ())])
 
-        for m in response.get("messages", []):
-            msgs.append(m["id"])
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
 
-        # NOTE: This is a simple version that doesn't chase nextPageToken.
-        # For WarnMe, you probably don't have thousands and thousands,
-        # but you can extend this later if needed.
         return msgs
 
     # --------------------------
     # Public: load one message
     # --------------------------
-    def load_message(self, msg_id: str) -> EmailRecord:
+    def load_message(self, msg_id: str, fetch_body: bool = True) -> EmailRecord:
         """
         Load a full Gmail message and convert it into an EmailRecord.
 
         Equivalent conceptually to Java's:
           gmail.users().messages().get(...).execute()
         plus some parsing of headers and body.
+
+        With fetch_body=False only the headers we use are requested
+        ('metadata' format, like find_email_received_time), and body_text
+        is left as None.
         """
         user_id = "me"
 
-        msg = (
-            self.service.users()
-            .messages()
-            .get(userId=user_id, id=msg_id, format="full")
-            .execute()
-        )
+        if fetch_body:
+            request = (
+                self.service.users()
+                .messages()
+                .get(userId=user_id, id=msg_id, format="full")
+            )
+        else:
+            request = (
+                self.service.users()
+                .messages()
+                .get(
+                    userId=user_id,
+                    id=msg_id,
+                    format="metadata",
+                    metadataHeaders=METADATA_HEADERS,
+                )
+            )
+
+        msg = request.execute()
+        return self._parse_message(msg, fetch_body=fetch_body)
+
+    # --------------------------
+    # Helper: raw message -> EmailRecord
+    # --------------------------
+    def _parse_message(
+        self,
+        msg: Dict[str, Any],
+        fetch_body: bool = True,
+    ) -> EmailRecord:
+        """
+        Turn a raw messages().get(format="full") response into an EmailRecord.
 
+        Shared by load_message() and the batched loader so both paths
+        extract headers and body the same way.
+        """
         payload = msg.get("payload", {})
-        subject = self._get_header(payload, "Subject")
-        sender = self._get_header(payload, "From")
-        to = self._get_header(payload, "To")
-        date_hdr = self._get_header(payload, "Date")
+        headers = self._header_map(payload)
+        subject = headers.get("subject")
+        sender = headers.get("from")
+        to = headers.get("to")
+        date_hdr = headers.get("date")
 
         received_iso = self._parse_received_iso(date_hdr)
-        body_text = self._decode_body(payload)
+        body_text = self._decode_body(payload) if fetch_body else None
         labels = msg.get("labelIds", [])
 
         return EmailRecord(
@@ -282,6 +356,110 @@ class GmailAPIWrapper:
             labels=labels,
         )
 
+    # --------------------------
+    # Helper: batched load
+    # --------------------------
+    @staticmethod
+    def _is_retryable(exception: Exception) -> bool:
+        """
+        True for errors worth retrying: rate limiting (429) and server
+        errors (5xx). Things like 404 (deleted message), 403 or a bad token
+        won't get better by waiting.
+        """
+        status = getattr(getattr(exception, "resp", None), "status", None)
+        try:
+            status = int(status)
+        except (TypeError, ValueError):
+            return False
+        return status == 429 or status >= 500
+
+    def _execute_batch(self, msg_ids: List[str], on_message) -> List[str]:
+        """
+        Send one batch request with a messages().get() call per id.
+
+        on_message(msg_id, response) is called for every message that came
+        back fine. Returns the ids that failed with a retryable error
+        (429 / 5xx), so the caller can retry them. Ids that failed for any
+        other reason are not returned; the caller loads those one by one.
+        If the whole batch fails with a non-retryable error, it is raised.
+        """
+        user_id = "me"
+        done = set()
+        retry: List[str] = []
+        errors = []
+
+        def on_response(request_id: str, response: Dict[str, Any], exception) -> None:
+            if exception is None:
+                on_message(request_id, response)
+                done.add(request_id)
+            else:
+                errors.append(exception)
+                if self._is_retryable(exception):
+                    retry.append(request_id)
+
+        batch = self.service.new_batch_http_request()
+        for mid in msg_ids:
+            batch.add(
+                self.service.users()
+                .messages()
+                .get(userId=user_id, id=mid, format="full"),
+                request_id=mid,
+                callback=on_response,
+            )
+        try:
+            batch.execute()
+        except Exception as e:
+            # The whole batch failed. Retry it on 429 / 5xx; anything else
+            # (bad token, network down, ...) fails right away.
+            if not self._is_retryable(e):
+                raise
+            errors.append(e)
+            retry = [mid for mid in msg_ids if mid not in done]
+
+        failed = len(msg_ids) - len(done)
+        if failed:
+            print(
+                f"Gmail batch: {failed} of {len(msg_ids)} messages failed, "
+                f"{len(retry)} will be retried "
+                f"(first error: {errors[0] if errors else 'no response'})"
+            )
+        return retry
+
+    def _batch_load_messages(self, msg_ids: List[str]) -> List[EmailRecord]:
+        """
+        Load many messages using Gmail's batch endpoint.
+
+        Instead of one HTTPS round trip per message (what calling
+        load_message() in a loop does), up to BATCH_SIZE messages().get()
+        calls are sent together in a single HTTP request.
+
+        Records are returned in the same order as msg_ids. Messages that
+        are rate limited or hit a server error are retried in smaller
+        follow-up batches with exponential backoff. Any message still
+        missing after that (other errors, or BATCH_RETRIES used up) is
+        loaded one by one with load_message(), which raises if it fails.
+
+        Each message is turned into a record as soon as it arrives, so raw
+        responses (with their base64 bodies) are never all held at once.
+        """
+        loaded: Dict[str, EmailRecord] = {}
+
+        def on_message(msg_id: str, response: Dict[str, Any]) -> None:
+            loaded[msg_id] = self._parse_message(response)
+
+        for start in range(0, len(msg_ids), BATCH_SIZE):
+            pending = self._execute_batch(msg_ids[start:start + BATCH_SIZE], on_message)
+            for attempt in range(BATCH_RETRIES):
+                if not pending:
+                    break
+                time.sleep(BATCH_BACKOFF_S * 2 ** attempt)
+                pending = self._execute_batch(pending, on_message)
+
+        return [
+            loaded[mid] if mid in loaded else self.load_message(mid)
+            for mid in msg_ids
+        ]
+
     # --------------------------
     # Public: find email received time only
     # --------------------------
@@ -329,7 +507,7 @@ class GmailAPIWrapper:
             query += f" newer_than:{newer_than}"
 
         msg_ids = self._search_message_ids(query, max_results=max_results)
-        return [self.load_message(mid) for mid in msg_ids]
+        return self._batch_load_messages(msg_ids)
 
     # --------------------------
     # Public: find by subject
@@ -349,7 +527,7 @@ class GmailAPIWrapper:
             query += f" newer_than:{newer_than}"
 
         msg_ids = self._search_message_ids(query, max_results=max_results)
-        return [self.load_message(mid) for mid in msg_ids]
+        return self._batch_load_messages(msg_ids)
 
     # --------------------------
     # Public: find after a time
@@ -376,7 +554,7 @@ class GmailAPIWrapper:
             query += f" from:{sender_email}"
 
         msg_ids = self._search_message_ids(query, max_results=max_results)
-        return [self.load_message(mid) for mid in msg_ids]
+        return self._batch_load_messages(msg_ids)
 
     # --------------------------
     # Public: generic find
@@ -390,7 +568,7 @@ class GmailAPIWrapper:
             'subject:(WarnMe) after:1730784000'
         """
         msg_ids = self._search_message_ids(query, max_results=max_results)
-        return [self.load_message(mid) for mid in msg_ids]
+        return self._batch_load_messages(msg_ids)
 
     # --------------------------
     # Public: export to CSV
@@ -404,19 +582,11 @@ class GmailAPIWrapper:
         """
         import csv
 
-        rows = [asdict(r) for r in records]
-
-        # If no records, still write a header row so the schema is visible.
-        if not rows:
-            fieldnames = [f.name for f in EmailRecord.__dataclass_fields__.values()]
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-            return
-
-        fieldnames = rows[0].keys()
+        # Rows are written one at a time as `records` is iterated, so a
+        # generator of records is never materialized in memory. If there
+        # are no records, the header row still shows the schema.
+        fieldnames = [f.name for f in fields(EmailRecord)]
         with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
-
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(astuple(r) for r in records)
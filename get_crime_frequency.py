@@ -1,7 +1,62 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Union, Tuple
+from typing import Optional, Union, Tuple
+
+try:
+    # optional: evaluates the haversine in one fused pass (no temporaries)
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+R_EARTH_M = 6_371_000.0  # meters
+
+
+def _haversine_m(lat1: float, lon1: float, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """
+    Great-circle distance in meters from (lat1, lon1) to each (lat2, lon2).
+    All inputs are in radians.
+    """
+    if ne is not None:
+        c = ne.evaluate(
+            "2 * arcsin(sqrt(sin((lat2 - lat1) / 2) ** 2"
+            " + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2))",
+            local_dict={"lat1": lat1, "lon1": lon1, "lat2": lat2, "lon2": lon2},
+        )
+    else:
+        a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        c = 2 * np.arcsin(np.sqrt(a))
+    return R_EARTH_M * c
+
+
+def _to_utc64(t: Union[str, datetime]) -> np.datetime64:
+    """Convert a query bound to naive-UTC datetime64, matching prepare_table()."""
+    return pd.to_datetime(t, utc=True).tz_convert(None).to_datetime64()
+
+
+def prepare_table(
+    table: pd.DataFrame,
+    latlon_col: str,
+    date_col: str,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Parse the lat/lon and date columns once, so many queries can reuse them.
+
+    Returns (lat_rad, lon_rad, dt), one entry per row of `table`:
+    coordinates in radians (NaN for invalid rows) and datetimes as naive
+    UTC datetime64 (NaT for invalid rows).
+    """
+    # convert to datetime (naive UTC, NaT for invalid rows)
+    dt = pd.to_datetime(table[date_col], errors="coerce", utc=True).dt.tz_convert(None).to_numpy()
+
+    # split lat, lon (NaN for invalid rows)
+    # (reindex: if no value has a comma, split yields only one column)
+    latlon_split = table[latlon_col].astype(str).str.split(",", n=1, expand=True).reindex(columns=[0, 1])
+    lat_rad = np.radians(pd.to_numeric(latlon_split[0], errors="coerce").to_numpy(dtype=float))
+    lon_rad = np.radians(pd.to_numeric(latlon_split[1], errors="coerce").to_numpy(dtype=float))
+
+    return lat_rad, lon_rad, dt
+
 
 def get_crime_frequency_from_table(
     table: pd.DataFrame,
@@ -12,39 +67,91 @@ def get_crime_frequency_from_table(
     r: float,
     start_time: Union[str, datetime],
     end_time: Union[str, datetime],
+    prepared: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
 ) -> Tuple[pd.DataFrame, int]:
     """
     Function: gives you frequency of the crime (Jennie)
 
+    Pass prepared=prepare_table(table, latlon_col, date_col) when querying
+    the same table many times, to skip re-parsing its columns every call.
+    """
+    # work on plain arrays; the input table is never copied or modified
+    if prepared is None:
+        prepared = prepare_table(table, latlon_col, date_col)
+    lat_rad, lon_rad, dt = prepared
+
+    start, end = _to_utc64(start_time), _to_utc64(end_time)
+
+    # cheap bounding-box pre-filter (no trig per row): r / R_earth radians
+    # of latitude and arcsin(sin(dlat) / cos(lat)) of longitude (the widest
+    # the circle gets); 10% slack for safety
+    lat1, lon1 = float(np.radians(lat)), float(np.radians(lon))
+    dlat = r / R_EARTH_M * 1.1
+    bbox = np.abs(lat_rad - lat1) <= dlat
+    if abs(lat1) + dlat < np.pi / 2:
+        # longitude difference wrapped to [-pi, pi) so the box works across
+        # the antimeridian; skipped when the circle reaches a pole, where
+        # every longitude can be in range
+        dlon = np.arcsin(min(np.sin(dlat) / np.cos(lat1), 1.0))
+        bbox &= np.abs((lon_rad - lon1 + np.pi) % (2 * np.pi) - np.pi) <= dlon
+
+    # Haversine formula to calculate real distance (only rows in the box)
+    dist_m = np.full(len(lat_rad), np.inf)
+    dist_m[bbox] = _haversine_m(lat1, lon1, lat_rad[bbox], lon_rad[bbox])
+
+    # filter invalid rows, then by distance and time
+    valid = ~np.isnan(lat_rad) & ~np.isnan(lon_rad) & ~np.isnat(dt)
+    mask = valid & (dist_m <= r) & (dt >= start) & (dt <= end)
+
+    return table.iloc[mask], int(mask.sum())
+
+
+class CrimeIndex:
     """
-    df = table.copy()
-
-    # convert to datetime & filter invalid rows
-    df["_dt"] = pd.to_datetime(df[date_col], errors="coerce", utc=True)
-    start = pd.to_datetime(start_time, utc=True)
-    end = pd.to_datetime(end_time, utc=True)
-
-    # split lat, lon & filter invalid rows
-    latlon_split = df[latlon_col].astype(str).str.split(",", n=1, expand=True)
-    df["_lat"] = pd.to_numeric(latlon_split[0], errors="coerce")
-    df["_lon"] = pd.to_numeric(latlon_split[1], errors="coerce")
-    df = df.dropna(subset=["_lat", "_lon", "_dt"]).copy()
-
-    # Haversine formula to calculate real distance
-    R_earth = 6_371_000.0  # meters
-    lat1, lon1 = np.radians(lat), np.radians(lon)
-    lat2, lon2 = np.radians(df["_lat"].to_numpy()), np.radians(df["_lon"].to_numpy())
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
-    c = 2 * np.arcsin(np.sqrt(a))
-    dist_m = R_earth * c
-
-    # filter by distance and time
-    mask = (dist_m <= r) & (df["_dt"].between(start, end))
-    filtered = df.loc[mask].copy()
-
-    return filtered, len(filtered)
+    Spatial index over a crime table, for answering many queries fast.
+
+    Builds a haversine BallTree over the valid rows once; each query()
+    then only looks at the rows near (lat, lon) instead of the whole table.
+    Same results as get_crime_frequency_from_table() (needs scikit-learn).
+    """
+
+    def __init__(self, table: pd.DataFrame, latlon_col: str, date_col: str):
+        from sklearn.neighbors import BallTree
+
+        self.table = table
+        lat_rad, lon_rad, dt = prepare_table(table, latlon_col, date_col)
+
+        # the tree can't hold NaN, so index only valid rows and remember
+        # their positions in the original table
+        valid = ~np.isnan(lat_rad) & ~np.isnan(lon_rad) & ~np.isnat(dt)
+        self._rows = np.flatnonzero(valid)
+        self._dt = dt[valid]
+        # BallTree rejects an empty array; with no valid rows, no tree
+        self._tree = (
+            BallTree(np.column_stack([lat_rad[valid], lon_rad[valid]]), metric="haversine")
+            if len(self._rows) else None
+        )
+
+    def query(
+        self,
+        lat: float,
+        lon: float,
+        r: float,
+        start_time: Union[str, datetime],
+        end_time: Union[str, datetime],
+    ) -> Tuple[pd.DataFrame, int]:
+        """Crimes within r meters of (lat, lon) between start_time and end_time."""
+        if self._tree is None:
+            return self.table.iloc[[]], 0
+
+        start, end = _to_utc64(start_time), _to_utc64(end_time)
+
+        hits = self._tree.query_radius(np.radians([[lat, lon]]), r=r / R_EARTH_M)[0]
+        hits = hits[(self._dt[hits] >= start) & (self._dt[hits] <= end)]
+
+        # back to table positions, in table order
+        rows = np.sort(self._rows[hits])
+        return self.table.iloc[rows], len(rows)
 
 
 # EXAMPLE USAGE
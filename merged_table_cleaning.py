@@ -3,39 +3,45 @@ import numpy as np
 from datetime import datetime
 from typing import Union, Tuple
 from pandas import read_csv
-import re
 
-data = pd.read_csv("C:/Users/garden/Desktop/univ/3-2/openpj/Data/merged.csv")
+# Copy-on-Write lets the chained steps below share data instead of copying.
+# It's always on (and the option deprecated) from pandas 3.0.
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
 
 onehot_columns = ['Progress', 'Priority', 'Race', 'Sex'] # Define categorical columns for one-hot encoding
-for col in onehot_columns: # Convert to categorical dtype
-    data[col] = data[col].astype('category')
-
-def height_to_inches(h):
-    if pd.isna(h):
-        return 0 
-    if not isinstance(h, str):
-        return 0  
-    
-    # Example: "5 ft. 3 in."
-    match = re.match(r'(\d+)\s*ft\.\s*(\d+)\s*in\.', h)
-    if match:
-        feet = int(match.group(1))
-        inches = int(match.group(2))
-        return feet * 12 + inches
-
-    return 0
 
-# Convert Height to inches
-data['Height_in_inches'] = data['Height'].apply(height_to_inches)
-
-
-# One-hot encoding for categorical variables
-data = pd.get_dummies(data, columns=onehot_columns, drop_first=True)
+# Read categorical / text columns straight into their final dtypes
+# (no second conversion pass); the pyarrow engine parses in parallel.
+data = pd.read_csv(
+    "C:/Users/garden/Desktop/univ/3-2/openpj/Data/merged.csv",
+    dtype={
+        **{col: 'category' for col in onehot_columns},
+        'Height': 'string',
+        'Call_Type': 'string',
+    },
+    engine='pyarrow',
+)
 
-
-data[['Call_Code', 'Call_Desc']] = data['Call_Type'].str.split(' - ', n=1, expand=True)
-data.drop(columns=['Call_Type'], inplace=True)
+# Convert Height to inches
+# Example: "5 ft. 3 in." -> 63. Missing / unparseable heights become 0.
+# Done on the whole column at once instead of a Python function per row.
+height_parts = data['Height'].astype('string').str.extract(r'^(\d+)\s*ft\.\s*(\d+)\s*in\.')
+feet = pd.to_numeric(height_parts[0], errors='coerce').fillna(0).astype('int32')
+inches = pd.to_numeric(height_parts[1], errors='coerce').fillna(0).astype('int32')
+
+# Split "CODE - Description" call types
+call_type = data['Call_Type'].str.split(' - ', n=1, expand=True)
+
+# Add inches, one-hot encode categorical variables, then swap Call_Type
+# for its two parts, as one chain (column order same as before)
+data = (
+    data
+    .assign(Height_in_inches=feet * 12 + inches)
+    .pipe(pd.get_dummies, columns=onehot_columns, drop_first=True)
+    .assign(Call_Code=call_type[0], Call_Desc=call_type[1])
+    .drop(columns=['Call_Type'])
+)
 
 print(data.head())
 
@@ -1,7 +1,12 @@
 from dotenv import load_dotenv
 import os
+import json
+import time
+import hashlib
+import threading
+from types import SimpleNamespace
 from firecrawl import Firecrawl
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 
 # -----------------------------------
@@ -11,11 +16,71 @@ load_dotenv()
 api_key = os.getenv("FIRECRAWL_API_KEY")
 fc = Firecrawl(api_key=api_key)
 
+# -----------------------------------
+# Disk cache for Firecrawl responses
+# -----------------------------------
+CACHE_DIR = os.path.join(".cache", "firecrawl")
+CACHE_TTL = 24 * 60 * 60  # seconds (1 day); articles rarely change
+HOMEPAGE_TTL = 0  # homepage lists new stories, so always scrape it fresh
+
+
+def cached_scrape(url, formats, ttl=CACHE_TTL):
+    """
+    fc.scrape(url, formats=formats), but reuse a saved response if the
+    same url + formats was scraped less than `ttl` seconds ago.
+
+    Responses are stored as JSON under .cache/firecrawl/<sha256>.json and
+    returned as an object with one attribute per format (.html, .links, ...),
+    just like the Firecrawl document.
+    """
+    key = hashlib.sha256((url + "|" + ",".join(formats)).encode("utf-8")).hexdigest()
+    path = os.path.join(CACHE_DIR, key + ".json")
+
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, encoding="utf-8") as f:
+                cached = json.load(f)
+            if all(fmt in cached for fmt in formats):
+                return SimpleNamespace(**cached)
+    except (OSError, ValueError, TypeError):
+        pass  # missing, unreadable or outdated cache file -> scrape again
+
+    doc = fc.scrape(url, formats=formats)
+    # default=str turns non-JSON values (e.g. link objects) into strings,
+    # so a fresh response looks exactly like one read back from the cache
+    text = json.dumps({fmt: getattr(doc, fmt, None) for fmt in formats}, default=str)
+
+    # ttl <= 0 means "never reuse", so there's no point saving it.
+    # Otherwise write to a temp file first so parallel scrapes never see
+    # half a file.
+    if ttl > 0:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    return SimpleNamespace(**json.loads(text))
+
+
+# -----------------------------------
+# Regexes (compiled once)
+# -----------------------------------
+_RE_AUTHOR = re.compile(r"By ([A-Za-z ]+)")
+_RE_DATE = re.compile(
+    r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s*\d{4}"
+)
+_RE_ARTICLE_PATH = re.compile(r"/\d{4}/\d{2}/\d{2}/")
+
+# Only build the tags we look at (lxml parser, everything else skipped)
+_H1_ONLY = SoupStrainer("h1")
+_IMG_ONLY = SoupStrainer("img")
+
 # -----------------------------------
 # Helper extraction functions
 # -----------------------------------
 def extract_title(html, md):
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml", parse_only=_H1_ONLY)
     h1 = soup.find("h1")
     if h1:
         return h1.get_text(strip=True)
@@ -24,20 +89,17 @@ def extract_title(html, md):
 
 
 def extract_author(md):
-    m = re.search(r"By ([A-Za-z ]+)", md)
+    m = _RE_AUTHOR.search(md)
     return m.group(1).strip() if m else None
 
 
 def extract_date(md):
-    m = re.search(
-        r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s*\d{4}",
-        md
-    )
+    m = _RE_DATE.search(md)
     return m.group(0) if m else None
 
 
 def extract_image(html):
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml", parse_only=_IMG_ONLY)
     img = soup.find("img")
     if img and img.get("src"):
         return img["src"]
@@ -49,9 +111,10 @@ def extract_image(html):
 # -----------------------------------
 def get_article_urls():
     print("Scraping homepage...")
-    home = fc.scrape(
+    home = cached_scrape(
         "https://www.berkeleyscanner.com/",
-        formats=["html", "links"]
+        formats=["html", "links"],
+        ttl=HOMEPAGE_TTL,
     )
 
     article_urls = []
@@ -59,7 +122,7 @@ def get_article_urls():
         url = str(link)
         if (
             "https://www.berkeleyscanner.com" in url 
-            and re.search(r"/\d{4}/\d{2}/\d{2}/", url)
+            and _RE_ARTICLE_PATH.search(url)
         ):
             article_urls.append(url)
 
@@ -73,7 +136,7 @@ def get_article_urls():
 # -----------------------------------
 def scrape_article(url):
     try:
-        data = fc.scrape(url, formats=["markdown", "html"])
+        data = cached_scrape(url, formats=["markdown", "html"])
     except Exception as e:
         print(f"Error scraping {url}: {e}")
         return None
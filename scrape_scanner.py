@@ -1,16 +1,37 @@
+import asyncio
 import csv
+from concurrent.futures import ThreadPoolExecutor
 from scanner_module import get_article_urls, scrape_article
 
+MAX_CONCURRENT = 16  # articles scraped at the same time
+
 # 1. collect url
 urls = get_article_urls()
 
-# 2. scrape each article
+# 2. scrape each article (concurrently: each scrape is just waiting on the network)
+async def scrape_one(sem, url):
+    async with sem:
+        print(f"Scraping article: {url}")
+        return await asyncio.to_thread(scrape_article, url)
+
+async def scrape_all(urls):
+    # to_thread runs on the loop's default executor, which may have fewer
+    # than MAX_CONCURRENT threads on small machines; give it enough
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=MAX_CONCURRENT)
+    )
+    sem = asyncio.Semaphore(MAX_CONCURRENT)
+    # return_exceptions: one failing url doesn't cancel the others
+    return await asyncio.gather(
+        *(scrape_one(sem, url) for url in urls), return_exceptions=True
+    )
+
 articles = []
-for url in urls:
-    print(f"Scraping article: {url}")
-    article = scrape_article(url)
-    if article:
-        articles.append(article)
+for url, result in zip(urls, asyncio.run(scrape_all(urls))):
+    if isinstance(result, Exception):
+        print(f"Error scraping {url}: {result}")
+    elif result:
+        articles.append(result)
 
 print("\nDONE! Extracted articles:")
 for a in articles: